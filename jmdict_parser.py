@@ -1,14 +1,28 @@
 """Parser for the JMdict_e_exampl.xml file."""
 
 import argparse
+import collections
+import concurrent.futures
 import contextlib
+import functools
 import itertools
 import logging
+import re
 import sys
 import textwrap
 import datetime
 
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 from lxml import etree
 from neo4j import GraphDatabase, Session, Transaction
@@ -16,13 +30,23 @@ from neo4j import GraphDatabase, Session, Transaction
 
 logger = logging.getLogger('jmdict')
 
+T = TypeVar('T')
+
 DOT = '\xb7'
 KANA_DOT = '\u30fb'
 
+# The xml:lang attribute name, in the standard XML namespace
+XML_LANG = '{http://www.w3.org/XML/1998/namespace}lang'
+
 HIRAGANA = ('\u3040', '\u309f')
 KATAKANA = ('\u30a0', '\u30ff')
 KATAKANA_PHONETIC_EXT = ('\u31f0', '\u31ff')
 
+# Matches strings made up only of characters in the kana ranges above
+KANA_RE = re.compile('[{}]*'.format(''.join(
+    f'{lo}-{hi}' for lo, hi in (HIRAGANA, KATAKANA, KATAKANA_PHONETIC_EXT)
+)))
+
 
 def is_kana(string: str) -> bool:
     """Returns ``True`` iff every character of `string` is a kana.
@@ -34,24 +58,28 @@ def is_kana(string: str) -> bool:
         ``True`` if the string is all kana, ``False`` otherwise.
     """
 
-    for c in string:
-        result = False
-        for lo, hi in (HIRAGANA, KATAKANA, KATAKANA_PHONETIC_EXT):
-            result = result or lo <= c <= hi
-        if not result:
-            return result
+    return KANA_RE.fullmatch(string) is not None
+
+
+class Xref(NamedTuple):
+    """A parsed cross-reference, as returned by `parse_xref`."""
 
-    return True
+    keb: Optional[str] = None
+    reb: Optional[str] = None
+    sense: Optional[int] = None
 
 
-def parse_xref(xref: str) -> Dict[str, Union[str, int]]:
+@functools.lru_cache(maxsize=65536)
+def parse_xref(xref: str) -> Xref:
     """Parses `xref` into a `keb`, `reb`, and `sense` rank.
 
+    Results are cached since the same xrefs recur throughout JMdict.
+
     Args:
         xref: The xref to parse.
 
     Returns:
-        Dictionary with as many as 3 keys:
+        Xref with as many as 3 fields set:
             - `keb`: The kanji cross-reference.
             - `reb`: The reading cross-reference.
             - `sense`: The sense rank number to cross-reference.
@@ -66,7 +94,539 @@ def parse_xref(xref: str) -> Dict[str, Union[str, int]]:
         else:
             result['keb'] = token
 
-    return result
+    return Xref(**result)
+
+
+def parse_entry(entry: etree.Element) -> Dict[str, Any]:
+    """Parses `entry` into a row of Entry node properties.
+
+    Args:
+        entry: The entry element.
+
+    Returns:
+        Dictionary with key `ent_seq`, the entry sequence number.
+    """
+
+    return {'ent_seq': int(entry.findtext('ent_seq'))}
+
+
+def parse_kanji(kanji: etree.Element, ent_seq: int) -> Dict[str, Any]:
+    """Parses `kanji` for entry `ent_seq` into a row of Kanji node properties.
+
+    Args:
+        kanji: The k_ele kanji element.
+        ent_seq: The ent_seq of the containing entry.
+
+    Returns:
+        Dictionary with keys `ent_seq`, `keb`, `ke_infs` and `ke_pris`.
+    """
+
+    return {
+        'ent_seq': ent_seq,
+        # Get the word or phrase (keb)
+        'keb': kanji.findtext('keb'),
+        # Gather the information and priority codes, interned since they
+        # come from small vocabularies repeated throughout JMdict
+        'ke_infs': [
+            sys.intern(elem.text) for elem in kanji.iterchildren('ke_inf')
+        ],
+        'ke_pris': [
+            sys.intern(elem.text) for elem in kanji.iterchildren('ke_pri')
+        ],
+    }
+
+
+def parse_reading(reading: etree.Element, ent_seq: int) -> Dict[str, Any]:
+    """Parses `reading` for entry `ent_seq` into a row of Reading properties.
+
+    Args:
+        reading: The r_ele reading element.
+        ent_seq: The ent_seq of the containing entry.
+
+    Returns:
+        Dictionary with keys `ent_seq`, `reb`, `re_nokanji`, `re_infs`,
+        `re_pris` and `re_restr`.
+    """
+
+    return {
+        'ent_seq': ent_seq,
+        # Get the word or phrase (reb)
+        'reb': reading.findtext('reb'),
+        # Get whether a true reading for the entry
+        're_nokanji': reading.find('re_nokanji') is not None,
+        # Gather the information and priority codes, interned since they
+        # come from small vocabularies repeated throughout JMdict
+        're_infs': [
+            sys.intern(elem.text) for elem in reading.iterchildren('re_inf')
+        ],
+        're_pris': [
+            sys.intern(elem.text) for elem in reading.iterchildren('re_pri')
+        ],
+        # Get kebs that reading applies to (all if None)
+        're_restr': reading.findtext('re_restr'),
+    }
+
+
+def parse_sense(
+    idx: int,
+    sense: etree.Element,
+    ent_seq: int,
+    kebs: List[str],
+    rebs: List[str],
+) -> Dict[str, Any]:
+    """Parses `sense` for entry `ent_seq` into a row of Sense node properties.
+
+    Args:
+        idx: Index of sense in parent entry element.
+        sense: The sense element.
+        ent_seq: The ent_seq of the containing entry.
+        kebs: All kebs of the containing entry.
+        rebs: All rebs of the containing entry.
+
+    Returns:
+        Dictionary with keys `ent_seq`, `rank`, `stagks`, `stagrs`, `pos`,
+        `fields`, `miscs`, `s_infs`, `defns`, `expls`, `figs`, `lits` and
+        `tms`.
+    """
+
+    # Gather kanji or readings this sense is restricted to, parts of speech,
+    # fields of application, misc and other information, and the various
+    # gloss lists by g_type, all in a single pass over the sense's children
+    # TODO: convert from codes to readable values OR
+    #       create nodes that represent each of these to relate to
+    stagks, stagrs, pos, fields, miscs, s_infs = [], [], [], [], [], []
+    defns, expls, figs, lits, tms = [], [], [], [], []
+    texts_by_tag = {'stagk': stagks, 'stagr': stagrs, 's_inf': s_infs}
+    codes_by_tag = {'pos': pos, 'field': fields, 'misc': miscs}
+    glosses = {None: defns, 'expl': expls, 'fig': figs, 'lit': lits, 'tm': tms}
+    for elem in sense:
+        if elem.tag == 'gloss':
+            texts = glosses.get(elem.get('g_type'))
+        elif elem.tag in codes_by_tag:
+            # Intern codes, which come from a small closed vocabulary
+            codes_by_tag[elem.tag].append(sys.intern(elem.text))
+            continue
+        else:
+            texts = texts_by_tag.get(elem.tag)
+        if texts is not None:
+            texts.append(elem.text)
+
+    # If there are no restrictions, stagk/rs should refer to all k/rebs
+    if not stagks:
+        stagks = kebs
+        stagrs = rebs
+
+    return {
+        'ent_seq': ent_seq,
+        # Set rank order of sense within entry
+        'rank': idx + 1,
+        'stagks': stagks,
+        'stagrs': stagrs,
+        'pos': pos,
+        'fields': fields,
+        'miscs': miscs,
+        's_infs': s_infs,
+        'defns': defns,
+        'expls': expls,
+        'figs': figs,
+        'lits': lits,
+        'tms': tms,
+    }
+
+
+def parse_lsource(
+    lsource: etree.Element,
+    ent_seq: int,
+    rank: int,
+) -> Dict[str, Any]:
+    """Parses `lsource` into a row of Sense->Language relationship properties.
+
+    Args:
+        lsource: The lsource element.
+        ent_seq: The ent_seq of the containing entry.
+        rank: The rank of the containing sense within its entry.
+
+    Returns:
+        Dictionary with keys `ent_seq`, `rank`, `lang`, `phrase`, `partial`
+        and `wasei`.
+    """
+
+    return {
+        'ent_seq': ent_seq,
+        'rank': rank,
+        # Parse lang, and check for ls_type and ls_wasei
+        'lang': lsource.attrib.get(XML_LANG, 'eng'),
+        'partial': lsource.attrib.get('ls_type', 'full') == 'partial',
+        'wasei': lsource.attrib.get('ls_wasei', 'n') == 'y',
+        # Get the source language word or phrase
+        'phrase': lsource.text,
+    }
+
+
+def parse_example(
+    example: etree.Element,
+    ent_seq: int,
+    rank: int,
+) -> Dict[str, Any]:
+    """Parses `example` into a row of Example node properties.
+
+    Args:
+        example: The example element.
+        ent_seq: The ent_seq of the containing entry.
+        rank: The rank of the containing sense within its entry.
+
+    Returns:
+        Dictionary with keys `ent_seq`, `rank`, `tat`, `ex_text`, `eng` and
+        `jpn`.
+    """
+
+    # <example>
+    # <ex_srce exsrc_type="tat">100041</ex_srce>
+    # <ex_text>学位</ex_text>
+    # <ex_sent xml:lang="jpn">彼は法学修士の学位を得た。</ex_sent>
+    # <ex_sent xml:lang="eng">He got a master's degree in law.</ex_sent>
+    # </example>
+
+    # Parse out Tatoeba sequence number (validating it is Tatoeba Project)
+    ex_srce = example.find('ex_srce')
+    exsrc_type = ex_srce.attrib.get('exsrc_type', 'tat')
+    assert exsrc_type == 'tat', f'Unexpected source type {exsrc_type!r}'
+
+    # Parse out the example sentences
+    # NOTE: The following test was used to confirm examples come in pairs
+    # > grep '<ex_sent' JMdict_e_examp.xml -n | \
+    # >>  cut -d: -f1 | awk 'NR > 1 { print $0 - prev } { prev = $0 }' | \
+    # >>  awk 'NR%2==1 { print $0 }' | \
+    # >>  uniq
+    # 1
+
+    ex_sents = {
+        el.attrib.get(XML_LANG, 'eng'): el.text
+        for el in example.iterchildren('ex_sent')
+    }
+
+    return {
+        'ent_seq': ent_seq,
+        'rank': rank,
+        'tat': ex_srce.text,
+        # Parse out the example text for this sense
+        'ex_text': example.findtext('ex_text'),
+        'eng': ex_sents['eng'],
+        'jpn': ex_sents['jpn'],
+    }
+
+
+def parse_ref(ref: etree.Element, ent_seq: int, rank: int) -> Dict[str, Any]:
+    """Parses `ref` (either ``xref`` or ``ant``) into a row of ref properties.
+
+    Args:
+        ref: The ref element.
+        ent_seq: The ent_seq of the containing entry.
+        rank: The rank of the containing sense within its entry.
+
+    Returns:
+        Dictionary with keys `ent_seq`, `rank`, `antonym`, and the `keb`,
+        `reb` and `sense` fields returned by `parse_xref`.
+    """
+
+    return {
+        'ent_seq': ent_seq,
+        'rank': rank,
+        # Figure out whether it is an antonym ref and parse the ref text
+        'antonym': ref.tag == 'ant',
+        **parse_xref(ref.text)._asdict(),
+    }
+
+
+def parse_entry_children(
+    entry: etree.Element,
+    ent_seq: int,
+    parse_refs: bool = True,
+) -> Tuple[List[Dict[str, Any]], ...]:
+    """Parses the k_ele, r_ele and sense children of `entry` into rows.
+
+    Args:
+        entry: The entry element.
+        ent_seq: The ent_seq of the entry.
+        parse_refs: Whether to parse xref and ant elements, or leave the
+            ref rows empty.
+
+    Returns:
+        Tuple of kanji, reading, sense, lsource, example and ref rows, as
+        returned by the respective parse functions. Reading rows also get
+        key `kebs`, the kebs they apply to.
+    """
+
+    kanji, readings, senses, lsources, examples, refs = [], [], [], [], [], []
+
+    # Walk the entry's children once; the DTD orders them k_ele*, r_ele+,
+    # sense+ so every keb and reb is known before any sense
+    kebs, rebs = [], []
+    rank = 0
+    for child in entry:
+        if child.tag == 'k_ele':
+            kanji.append(parse_kanji(child, ent_seq))
+            kebs.append(kanji[-1]['keb'])
+
+        elif child.tag == 'r_ele':
+            reading = parse_reading(child, ent_seq)
+            # Resolve the kebs the reading applies to (all if unrestricted)
+            if reading['re_restr'] is not None:
+                reading['kebs'] = [reading['re_restr']]
+            else:
+                reading['kebs'] = kebs
+            readings.append(reading)
+            rebs.append(reading['reb'])
+
+        elif child.tag == 'sense':
+            senses.append(parse_sense(rank, child, ent_seq, kebs, rebs))
+            rank += 1
+
+            for lsource in child.iterchildren('lsource'):
+                lsources.append(parse_lsource(lsource, ent_seq, rank))
+
+            for example in child.iterchildren('example'):
+                examples.append(parse_example(example, ent_seq, rank))
+
+            if parse_refs:
+                for ref in child.iterchildren('xref', 'ant'):
+                    refs.append(parse_ref(ref, ent_seq, rank))
+
+    return kanji, readings, senses, lsources, examples, refs
+
+
+def iterparse_entries(xml_file: str) -> Iterator[etree.Element]:
+    """Streams the ``entry`` elements of `xml_file`.
+
+    Only the yielded entries and those after them are kept in memory: call
+    `free_entry` on each entry once done with it.
+
+    Args:
+        xml_file: The JMdict XML file to parse.
+
+    Returns:
+        Iterator of entry elements.
+    """
+
+    # Skip building whitespace, comment and PI nodes and the ID map, none of
+    # which are used; JMdict is also large enough to need huge_tree
+    context = etree.iterparse(
+        xml_file,
+        events=('end',),
+        tag='entry',
+        remove_blank_text=True,
+        remove_comments=True,
+        remove_pis=True,
+        collect_ids=False,
+        huge_tree=True,
+    )
+    return (entry for _, entry in context)
+
+
+def free_entry(entry: etree.Element):
+    """Clears `entry` and deletes the entries preceding it from the tree.
+
+    Args:
+        entry: The entry element, as yielded by `iterparse_entries`.
+    """
+
+    entry.clear(keep_tail=True)
+    while entry.getprevious() is not None:
+        del entry.getparent()[0]
+
+
+# Name the database that a session without one runs against
+CYPHER_HOME_DATABASE = textwrap.dedent("""\
+    CALL db.info() YIELD name
+    RETURN name
+""")
+
+CYPHER_ENTRY_CONSTRAINT = textwrap.dedent("""\
+    CREATE CONSTRAINT entry_ent_seq IF NOT EXISTS ON (n:Entry)
+    ASSERT n.ent_seq IS UNIQUE
+""")
+
+CYPHER_LSOURCE_CONSTRAINT = textwrap.dedent("""\
+    CREATE CONSTRAINT lsource_lang IF NOT EXISTS ON (n:Language)
+    ASSERT n.lang IS UNIQUE
+""")
+
+CYPHER_EXAMPLE_CONSTRAINT = textwrap.dedent("""\
+    CREATE CONSTRAINT example_tat IF NOT EXISTS ON (n:Example)
+    ASSERT n.tat IS UNIQUE
+""")
+
+CYPHER_KANJI_INDEX = textwrap.dedent("""\
+    CREATE INDEX kanji_keb IF NOT EXISTS FOR (n:Kanji) ON (n.keb)
+""")
+
+CYPHER_READING_INDEX = textwrap.dedent("""\
+    CREATE INDEX reading_reb IF NOT EXISTS FOR (n:Reading) ON (n.reb)
+""")
+
+CYPHER_SENSE_INDEX = textwrap.dedent("""\
+    CREATE INDEX sense_ent_seq_rank IF NOT EXISTS FOR (n:Sense)
+    ON (n.ent_seq, n.rank)
+""")
+
+# Block until all indexes (including those backing constraints) are online
+CYPHER_AWAIT_INDEXES = textwrap.dedent("""\
+    CALL db.awaitIndexes($timeout)
+""")
+
+# Add a node for each entry
+CYPHER_MERGE_ENTRIES = textwrap.dedent("""\
+    UNWIND $rows AS row
+    MERGE (n:Entry {ent_seq: row.ent_seq})
+    RETURN row.ent_seq AS ent_seq, id(n) AS node_id
+""")
+
+# Create a node for each entry, for a first load into an empty database
+CYPHER_CREATE_ENTRIES = textwrap.dedent("""\
+    UNWIND $rows AS row
+    CREATE (n:Entry {ent_seq: row.ent_seq})
+    RETURN row.ent_seq AS ent_seq, id(n) AS node_id
+""")
+
+# Find the existing node for each entry
+CYPHER_MATCH_ENTRIES = textwrap.dedent("""\
+    UNWIND $rows AS row
+    MATCH (n:Entry {ent_seq: row.ent_seq})
+    RETURN row.ent_seq AS ent_seq, id(n) AS node_id
+""")
+
+# Add a node for each kanji
+CYPHER_MERGE_KANJI = textwrap.dedent("""\
+    UNWIND $rows AS row
+    MATCH (e:Entry)
+    WHERE id(e) = row.entry_id
+    MERGE (e)-[:CONTAINS]->(k:Kanji {keb: row.keb})
+    SET k += {ke_inf: row.ke_infs, ke_pri: row.ke_pris}
+    RETURN count(*) AS count
+""")
+
+# Add a node for each reading
+CYPHER_MERGE_READINGS = textwrap.dedent("""\
+    UNWIND $rows AS row
+    MATCH (e:Entry)
+    WHERE id(e) = row.entry_id
+    MERGE (e)-[:CONTAINS]->(r:Reading {reb: row.reb})
+    SET r += {
+      re_inf: row.re_infs,
+      re_pri: row.re_pris,
+      re_nokanji: row.re_nokanji
+    }
+    RETURN count(*) AS count
+""")
+
+# Add a relationship from each kanji the reading applies to
+CYPHER_MERGE_KANJI_READINGS = textwrap.dedent("""\
+    UNWIND $rows AS row
+    MATCH (e:Entry)-[:CONTAINS]->(n:Reading {reb: row.reb})
+    WHERE id(e) = row.entry_id
+    UNWIND row.kebs AS keb
+    MATCH (e)-[:CONTAINS]->(k:Kanji {keb: keb})
+    MERGE (k)-[r:HAS_READING]->(n)
+    RETURN count(*) AS count
+""")
+
+# Add a node for each sense
+CYPHER_MERGE_SENSES = textwrap.dedent("""\
+    UNWIND $rows AS row
+    MATCH (e:Entry)
+    WHERE id(e) = row.entry_id
+    MERGE (e)-[:CONTAINS]->
+          (s:Sense {ent_seq: row.ent_seq, rank: row.rank})
+    SET s += {
+      pos: row.pos,
+      field: row.fields,
+      misc: row.miscs,
+      s_inf: row.s_infs,
+      defn: row.defns,
+      expl: row.expls,
+      fig: row.figs,
+      lit: row.lits,
+      tm: row.tms
+    }
+    RETURN count(*) AS count
+""")
+
+# Add a relationship for each restricted kanji
+CYPHER_MERGE_KANJI_SENSES = textwrap.dedent("""\
+    UNWIND $rows AS row
+    MATCH (e:Entry)-[:CONTAINS]->(s:Sense {rank: row.rank})
+    WHERE id(e) = row.entry_id
+    UNWIND row.stagks AS keb
+    MATCH (e)-[:CONTAINS]->(k:Kanji {keb: keb})
+    MERGE (k)-[r:HAS_SENSE]->(s)
+    RETURN count(*) AS count
+""")
+
+# Add a relationship for each restricted reading
+CYPHER_MERGE_READING_SENSES = textwrap.dedent("""\
+    UNWIND $rows AS row
+    MATCH (e:Entry)-[:CONTAINS]->(s:Sense {rank: row.rank})
+    WHERE id(e) = row.entry_id
+    UNWIND row.stagrs AS reb
+    MATCH (e)-[:CONTAINS]->(k:Reading {reb: reb})
+    MERGE (k)-[r:HAS_SENSE]->(s)
+    RETURN count(*) AS count
+""")
+
+# Add a node for each language and relate its sense to it
+CYPHER_MERGE_LSOURCES = textwrap.dedent("""\
+    UNWIND $rows AS row
+    MATCH (s:Sense {ent_seq: row.ent_seq, rank: row.rank})
+    USING INDEX s:Sense(ent_seq, rank)
+    MERGE (l:Language {lang: row.lang})
+    MERGE (s)-[r:SOURCED_FROM]->(l)
+    SET r += {
+      phrase: row.phrase,
+      partial: row.partial,
+      wasei: row.wasei
+    }
+    RETURN count(*) AS count
+""")
+
+# Add a node for each example and relate its sense to it
+CYPHER_MERGE_EXAMPLES = textwrap.dedent("""\
+    UNWIND $rows AS row
+    MATCH (s:Sense {ent_seq: row.ent_seq, rank: row.rank})
+    USING INDEX s:Sense(ent_seq, rank)
+    MERGE (e:Example {tat: row.tat})
+    MERGE (s)-[r:USED_IN]->(e)
+    SET
+      r.ex_text = row.ex_text,
+      e += {eng: row.eng, jpn: row.jpn}
+    RETURN count(*) AS count
+""")
+
+# For each ref:
+# 1. find the kanji
+# 2. find the parent entries
+# 3. order those entries by ent_seq number
+# 4. relate the sense to only the kanji that is beneath the 1st entry
+CYPHER_MERGE_REFS = textwrap.dedent("""\
+    UNWIND $rows AS row
+    CALL {
+      WITH row
+      MATCH (r:Reading)-[:CONTAINS]-(e:Entry)-[:CONTAINS]->(k:Kanji)
+      WHERE
+        r.reb = coalesce(row.reb, r.reb) AND
+        (row.keb IS NULL OR (k IS NOT NULL AND k.keb = row.keb))
+      WITH row, e
+      ORDER BY e.ent_seq
+      LIMIT 1
+      MATCH (src:Sense {ent_seq: row.ent_seq, rank: row.rank})
+      USING INDEX src:Sense(ent_seq, rank)
+      WITH row, e, src
+      MATCH (e)-[:CONTAINS]->(dest:Sense)
+      WHERE row.sense IS NULL OR dest.rank = row.sense
+      MERGE (src)-[xref:RELATED_TO {antonym: row.antonym}]->(dest)
+      RETURN count(xref) AS merged
+    }
+    RETURN sum(merged) AS count
+""")
 
 
 class NeoApp:
@@ -76,13 +636,22 @@ class NeoApp:
         uri: The URI for the driver connection.
         user: The username for authentication.
         password: The password for authentication.
+        database: The database to write to, or None for the user's home
+            database, which `resolve_database` then looks up by name.
     """
 
-    def __init__(self, uri: str, user: str, password: str):
+    def __init__(
+        self,
+        uri: str,
+        user: str,
+        password: str,
+        database: Optional[str] = None,
+    ):
         """Constructor."""
 
         self.uri = uri
         self.user = user
+        self.database = database
         logger.debug('Initializing driver, URI: %s', uri)
         self.driver = GraphDatabase.driver(uri, auth=(user, password))
 
@@ -96,21 +665,40 @@ class NeoApp:
             self.closed = True
             self.driver.close()
 
-    def __del__(self):
-        """Destructor."""
+    def __enter__(self) -> 'NeoApp':
+        """Enters the runtime context, returning the application itself."""
+
+        return self
+
+    def __exit__(self, *exc_info):
+        """Exits the runtime context, closing the driver connection."""
 
         self.close()
 
+    def open_session(self) -> Session:
+        """Opens a driver session on the application's database."""
+
+        return self.driver.session(database=self.database)
+
+    def resolve_database(self):
+        """Names the home database once if no database was given.
+
+        Sessions opened without a database name make the driver look up
+        the home database every time, so look it up once and pin it.
+        """
+
+        if self.database is None:
+            with self.driver.session() as session:
+                result = session.run(CYPHER_HOME_DATABASE)
+                self.database = result.single()['name']
+            logger.debug('Using home database: %s', self.database)
+
     def create_entry_constraint(self, session: Optional[Session] = None):
         """Creates a uniqueness constraint on ``ent_seq`` for Entry nodes."""
 
-        cypher = textwrap.dedent("""\
-            CREATE CONSTRAINT entry_ent_seq IF NOT EXISTS ON (n:Entry)
-            ASSERT n.ent_seq IS UNIQUE
-        """)
         with contextlib.ExitStack() as stack:
-            session = session or stack.enter_context(self.driver.session())
-            session.run(cypher)
+            session = session or stack.enter_context(self.open_session())
+            session.run(CYPHER_ENTRY_CONSTRAINT)
             logger.debug(
                 'Added uniqueness constraint for ent_seq on Entry nodes',
             )
@@ -118,13 +706,9 @@ class NeoApp:
     def create_lsource_constraint(self, session: Optional[Session] = None):
         """Creates a uniqueness constraint on ``lang`` for Language nodes."""
 
-        cypher = textwrap.dedent("""\
-            CREATE CONSTRAINT lsource_lang IF NOT EXISTS ON (n:Language)
-            ASSERT n.lang IS UNIQUE
-        """)
         with contextlib.ExitStack() as stack:
-            session = session or stack.enter_context(self.driver.session())
-            session.run(cypher)
+            session = session or stack.enter_context(self.open_session())
+            session.run(CYPHER_LSOURCE_CONSTRAINT)
             logger.debug(
                 'Added uniqueness constraint for lang on Language nodes',
             )
@@ -132,13 +716,9 @@ class NeoApp:
     def create_example_constraint(self, session: Optional[Session] = None):
         """Creates a uniqueness constraint on ``tat`` for Example nodes."""
 
-        cypher = textwrap.dedent("""\
-            CREATE CONSTRAINT example_tat IF NOT EXISTS ON (n:Example)
-            ASSERT n.tat IS UNIQUE
-        """)
         with contextlib.ExitStack() as stack:
-            session = session or stack.enter_context(self.driver.session())
-            session.run(cypher)
+            session = session or stack.enter_context(self.open_session())
+            session.run(CYPHER_EXAMPLE_CONSTRAINT)
             logger.debug(
                 'Added uniqueness constraint for tat on Example nodes',
             )
@@ -146,12 +726,9 @@ class NeoApp:
     def create_kanji_index(self, session: Optional[Session] = None):
         """Creates an single-property index for Kanji on ``keb``."""
 
-        cypher = textwrap.dedent("""\
-            CREATE INDEX kanji_keb IF NOT EXISTS FOR (n:Kanji) ON (n.keb)
-        """)
         with contextlib.ExitStack() as stack:
-            session = session or stack.enter_context(self.driver.session())
-            session.run(cypher)
+            session = session or stack.enter_context(self.open_session())
+            session.run(CYPHER_KANJI_INDEX)
             logger.debug(
                 'Added index for Kanji nodes on keb',
             )
@@ -159,12 +736,9 @@ class NeoApp:
     def create_reading_index(self, session: Optional[Session] = None):
         """Creates an single-property index for Reading on ``reb``."""
 
-        cypher = textwrap.dedent("""\
-            CREATE INDEX reading_reb IF NOT EXISTS FOR (n:Reading) ON (n.reb)
-        """)
         with contextlib.ExitStack() as stack:
-            session = session or stack.enter_context(self.driver.session())
-            session.run(cypher)
+            session = session or stack.enter_context(self.open_session())
+            session.run(CYPHER_READING_INDEX)
             logger.debug(
                 'Added index for Reading nodes on reb',
             )
@@ -173,704 +747,297 @@ class NeoApp:
         """Creates a composite-property index for Sense on (``ent_seq, rank``).
         """
 
-        cypher = textwrap.dedent("""\
-            CREATE INDEX sense_ent_seq_rank IF NOT EXISTS FOR (n:Sense)
-            ON (n.ent_seq, n.rank)
-        """)
         with contextlib.ExitStack() as stack:
-            session = session or stack.enter_context(self.driver.session())
-            session.run(cypher)
+            session = session or stack.enter_context(self.open_session())
+            session.run(CYPHER_SENSE_INDEX)
             logger.debug(
                 'Added composite index for Sense nodes on (ent_seq, rank)',
             )
 
-    def add_entry(
+    def await_indexes(
         self,
-        entry: etree.Element,
+        timeout: int = 300,
         session: Optional[Session] = None,
-    ) -> int:
-        """Adds an `entry` to the database.
+    ):
+        """Waits for all indexes to come online.
 
         Args:
-            entry: The entry element.
+            timeout: Seconds to wait before the database raises an error.
             session: A driver session for the work.
         """
 
-        # Get the ID (ent_seq)
-        ent_seq = int(entry.find('ent_seq').text)
-
         with contextlib.ExitStack() as stack:
-            session = session or stack.enter_context(self.driver.session())
-            node_id = session.write_transaction(
-                self._merge_and_return_entry,
-                ent_seq,
-            )
-            logger.debug(
-                'Added entry with ent_seq %s, ID: %s',
-                ent_seq,
-                node_id,
-            )
-            return node_id
+            session = session or stack.enter_context(self.open_session())
+            session.run(CYPHER_AWAIT_INDEXES, timeout=timeout).consume()
+            logger.debug('All indexes online')
 
-    @staticmethod
-    def _merge_and_return_entry(tx: Transaction, ent_seq: int) -> int:
-        """Merges and returns entry `ent_seq` in the database."""
+    def ensure_schema(self):
+        """Creates all constraints and indexes and waits for them to populate.
 
-        # Add a node for the entry
-        cypher = "MERGE (n:Entry {ent_seq: $ent_seq}) RETURN id(n) AS node_id"
-        result = tx.run(cypher, ent_seq=ent_seq)
-        record = result.single()
-        return record['node_id']
+        Run before loading so that merges never fall back to label scans.
+        """
 
-    def add_kanji_for_entry(
-        self,
-        kanji: etree.Element,
-        entry: etree.Element,
-        session: Optional[Session] = None,
-    ) -> int:
-        """Adds `kanji` for `entry` to the database.
+        with self.open_session() as session:
+            # Set constraints for DB schema
+            self.create_entry_constraint(session)
+            self.create_lsource_constraint(session)
+            self.create_example_constraint(session)
 
-        Args:
-            kanji: The k_ele kanji element.
-            entry: The entry element.
-            session: A driver session for the work.
-        """
+            # Create indices for DB schema
+            self.create_kanji_index(session)
+            self.create_reading_index(session)
+            self.create_sense_index(session)
 
-        # Get the word or phrase (keb)
-        keb = kanji.find('keb').text
+            self.await_indexes(session=session)
 
-        # Gather the information and priority codes
-        ke_infs = [elem.text for elem in kanji.findall('ke_inf')]
-        ke_pris = [elem.text for elem in kanji.findall('ke_pri')]
+    def ingest_entry_batch(
+        self,
+        entries: List[Dict[str, Any]],
+        kanji: List[Dict[str, Any]],
+        readings: List[Dict[str, Any]],
+        senses: List[Dict[str, Any]],
+        lsources: List[Dict[str, Any]],
+        examples: List[Dict[str, Any]],
+        entry_mode: str = 'merge',
+    ):
+        """Adds a batch of entries and their children in one transaction.
 
-        # Get the ent_seq of the containing entry
-        ent_seq = int(entry.find('ent_seq').text)
+        Args:
+            entries: The entry rows, as returned by `parse_entry`.
+            kanji: The kanji rows, as returned by `parse_kanji`.
+            readings: The reading rows, as returned by `parse_reading`.
+            senses: The sense rows, as returned by `parse_sense`.
+            lsources: The lsource rows, as returned by `parse_lsource`.
+            examples: The example rows, as returned by `parse_example`.
+            entry_mode: How to write the entries themselves: ``'merge'``
+                them, ``'create'`` them without merging (relying on the
+                ``ent_seq`` constraint to reject duplicates), or ``'skip'``
+                them and only look up the existing entries to add children to.
+        """
 
-        with contextlib.ExitStack() as stack:
-            session = session or stack.enter_context(self.driver.session())
-            node_id = session.write_transaction(
-                self._merge_and_return_kanji,
-                ent_seq,
-                keb,
-                ke_infs,
-                ke_pris,
+        with self.open_session() as session:
+            session.write_transaction(
+                self._merge_entry_batch,
+                entries,
+                kanji,
+                readings,
+                senses,
+                lsources,
+                examples,
+                entry_mode,
             )
+
+    @classmethod
+    def _merge_entry_batch(
+        cls,
+        tx: Transaction,
+        entries: List[Dict[str, Any]],
+        kanji: List[Dict[str, Any]],
+        readings: List[Dict[str, Any]],
+        senses: List[Dict[str, Any]],
+        lsources: List[Dict[str, Any]],
+        examples: List[Dict[str, Any]],
+        entry_mode: str,
+    ):
+        """Merges a batch of entries and their children, parents first."""
+
+        # Keep the entries' node IDs so children can match them by ID
+        if entry_mode == 'skip':
+            entry_ids = cls._match_and_return_entries(tx, entries)
+        elif entry_mode == 'create':
+            entry_ids = cls._create_and_return_entries(tx, entries)
+            logger.debug('Created %s entries', len(entry_ids))
+        else:
+            entry_ids = cls._merge_and_return_entries(tx, entries)
+            logger.debug('Added %s entries', len(entry_ids))
+        for row in itertools.chain(kanji, readings, senses):
+            row['entry_id'] = entry_ids.get(row['ent_seq'])
+
+        if kanji:
+            count = cls._merge_and_return_kanji_for_entries(tx, kanji)
+            logger.debug('Added %s kanji', count)
+
+        if readings:
+            count = cls._merge_and_return_readings_for_entries(tx, readings)
+            kanji_count = cls._merge_kanji_reading_relationships(tx, readings)
             logger.debug(
-                'Added kanji %s to entry %s, ID: %s',
-                keb,
-                ent_seq,
-                node_id,
+                'Added %s readings, %s kanji relationships',
+                count,
+                kanji_count,
             )
-            return node_id
 
-    @staticmethod
-    def _merge_and_return_kanji(
-        tx: Transaction,
-        ent_seq: int,
-        keb: str,
-        ke_infs: List[str],
-        ke_pris: List[str],
-    ) -> int:
-        """Merges and returns kanji `keb` related to entry `ent_seq`."""
-
-        # Add a node for the entry
-        cypher = textwrap.dedent("""\
-            MATCH (e:Entry {ent_seq: $ent_seq})
-            MERGE (e)-[:CONTAINS]->(k:Kanji {keb: $keb})
-            ON CREATE
-              SET k.ke_inf = $ke_infs
-              SET k.ke_pri = $ke_pris
-            RETURN id(k) AS node_id
-        """)
-        result = tx.run(
-            cypher,
-            ent_seq=ent_seq,
-            keb=keb,
-            ke_infs=ke_infs,
-            ke_pris=ke_pris,
-        )
-        record = result.single()
-        return record['node_id']
+        if senses:
+            count = cls._merge_and_return_senses_for_entries(tx, senses)
+            logger.debug('Added %s senses', count)
+            count = cls._merge_kanji_sense_relationships(tx, senses)
+            logger.debug('Added %s sense relationships to kanji', count)
+            count = cls._merge_reading_sense_relationships(tx, senses)
+            logger.debug('Added %s sense relationships to readings', count)
 
-    def add_reading_for_entry(
-        self,
-        reading: etree.Element,
-        entry: etree.Element,
-        session: Optional[Session] = None,
-    ) -> int:
-        """Adds a `reading` for `entry` to the database.
+        if lsources:
+            count = cls._merge_and_return_lsources_for_senses(tx, lsources)
+            logger.debug('Added %s lsources', count)
 
-        Args:
-            reading: The r_ele reading element.
-            entry: The entry element.
-            session: A driver session for the work.
-        """
+        if examples:
+            count = cls._merge_and_return_examples_for_senses(tx, examples)
+            logger.debug('Added %s examples', count)
 
-        # Get the word or phrase (reb)
-        reb = reading.find('reb').text
+    @staticmethod
+    def _merge_and_return_entries(
+        tx: Transaction,
+        rows: List[Dict[str, Any]],
+    ) -> Dict[int, int]:
+        """Merges and returns entry node IDs by ``ent_seq`` for `rows`."""
 
-        # Gather the information and priority codes
-        re_infs = [elem.text for elem in reading.findall('re_inf')]
-        re_pris = [elem.text for elem in reading.findall('re_pri')]
+        result = tx.run(CYPHER_MERGE_ENTRIES, rows=rows)
+        return {record['ent_seq']: record['node_id'] for record in result}
 
-        # Get whether a true reading for the entry
-        re_nokanji = reading.find('re_nokanji') is not None
+    @staticmethod
+    def _create_and_return_entries(
+        tx: Transaction,
+        rows: List[Dict[str, Any]],
+    ) -> Dict[int, int]:
+        """Creates and returns entry node IDs by ``ent_seq`` for `rows`."""
 
-        # Get kebs that reading applies to (all if None)
-        re_restr = reading.find('re_restr')
-        if re_restr is not None:
-            re_restr = re_restr.text
+        result = tx.run(CYPHER_CREATE_ENTRIES, rows=rows)
+        return {record['ent_seq']: record['node_id'] for record in result}
 
-        # Get the ent_seq of the containing entry
-        ent_seq = int(entry.find('ent_seq').text)
+    @staticmethod
+    def _match_and_return_entries(
+        tx: Transaction,
+        rows: List[Dict[str, Any]],
+    ) -> Dict[int, int]:
+        """Returns existing entry node IDs by ``ent_seq`` for `rows`."""
 
-        with contextlib.ExitStack() as stack:
-            session = session or stack.enter_context(self.driver.session())
-            node_id = session.write_transaction(
-                self._merge_and_return_reading,
-                ent_seq,
-                reb,
-                re_nokanji,
-                re_infs,
-                re_pris,
-            )
-            kanji = session.write_transaction(
-                self._merge_kanji_reading_relationships,
-                ent_seq,
-                reb,
-                re_restr,
-            )
-            logger.debug(
-                'Added reading %s to entry %s, (ID, kanji): %s, %s',
-                reb,
-                ent_seq,
-                node_id,
-                kanji,
-            )
-            return node_id
+        result = tx.run(CYPHER_MATCH_ENTRIES, rows=rows)
+        return {record['ent_seq']: record['node_id'] for record in result}
 
     @staticmethod
-    def _merge_and_return_reading(
+    def _merge_and_return_kanji_for_entries(
         tx: Transaction,
-        ent_seq: int,
-        reb: str,
-        re_nokanji: bool,
-        re_infs: List[str],
-        re_pris: List[str],
+        rows: List[Dict[str, Any]],
     ) -> int:
-        """Merges and returns reading `reb` related to entry `ent_seq`."""
-
-        # Add a node for the entry
-        cypher = textwrap.dedent("""\
-            MATCH (e:Entry {ent_seq: $ent_seq})
-            MERGE (e)-[:CONTAINS]->(r:Reading {reb: $reb})
-            ON CREATE
-              SET r.re_inf = $re_infs
-              SET r.re_pri = $re_pris
-              SET r.re_nokanji = $re_nokanji
-            RETURN id(r) AS node_id
-        """)
-        result = tx.run(
-            cypher,
-            ent_seq=ent_seq,
-            reb=reb,
-            re_nokanji=re_nokanji,
-            re_infs=re_infs,
-            re_pris=re_pris,
-        )
-        record = result.single()
-        return record['node_id']
+        """Merges kanji for `rows` into their entries and counts them."""
+
+        result = tx.run(CYPHER_MERGE_KANJI, rows=rows)
+        return result.single()['count']
 
     @staticmethod
-    def _merge_kanji_reading_relationships(
+    def _merge_and_return_readings_for_entries(
         tx: Transaction,
-        ent_seq: int,
-        reb: str,
-        re_restr: Union[str, None],
-    ) -> List[int]:
-        """Merges kanji relationships for `reb` related to entry `ent_seq`."""
-
-        # Add kanji reading relationships
-        cypher = textwrap.dedent("""\
-            MATCH (e:Entry {ent_seq: $ent_seq})
-            OPTIONAL MATCH (e)-[:CONTAINS]->(k:Kanji)
-            WITH e, k
-            WHERE k IS NOT NULL AND k.keb = coalesce($re_restr, k.keb)
-            MATCH (n:Reading {reb: $reb})<-[:CONTAINS]-(e)
-            MERGE (k)-[r:HAS_READING]->(n)
-            RETURN id(k) AS node_id
-        """)
-        result = tx.run(
-            cypher,
-            ent_seq=ent_seq,
-            reb=reb,
-            re_restr=re_restr,
-        )
-        values = [record.value() for record in result]
-        return values
-
-    def add_sense_for_entry(
-        self,
-        idx: int,
-        sense: etree.Element,
-        entry: etree.Element,
-        session: Optional[Session] = None,
+        rows: List[Dict[str, Any]],
     ) -> int:
-        """Adds a `sense` for `entry` to the database.
+        """Merges readings for `rows` into their entries and counts them."""
 
-        Args:
-            idx: Index of sense in parent entry element.
-            sense: The sense element.
-            entry: The entry element.
-            session: A driver session for the work.
-        """
+        result = tx.run(CYPHER_MERGE_READINGS, rows=rows)
+        return result.single()['count']
 
-        # Set rank order of sense within entry
-        rank = idx + 1
-
-        # Gather kanji or readings this sense is restricted to
-        stagks = [elem.text for elem in sense.findall('stagk')]
-        stagrs = [elem.text for elem in sense.findall('stagr')]
-
-        # If there are no restrictions, stagk/rs should refer to all k/rebs
-        if not stagks:
-            stagks = [elem.text for elem in entry.xpath('.//keb')]
-            stagrs = [elem.text for elem in entry.xpath('.//reb')]
-
-        # Gather parts of speech, fields of application, misc information
-        # TODO: convert from codes to readable values OR
-        #       create nodes that represent each of these to relate to
-        pos = [elem.text for elem in sense.findall('pos')]
-        fields = [elem.text for elem in sense.findall('field')]
-        miscs = [elem.text for elem in sense.findall('misc')]
-
-        # Gather other sense information
-        s_infs = [elem.text for elem in sense.findall('s_inf')]
-
-        # Gather various gloss lists by g_type
-        defns = [elem.text for elem in sense.xpath('gloss[not(@g_type)]')]
-        expls = [elem.text for elem in sense.xpath('gloss[@g_type="expl"]')]
-        figs = [elem.text for elem in sense.xpath('gloss[@g_type="fig"]')]
-        lits = [elem.text for elem in sense.xpath('gloss[@g_type="lit"]')]
-        tms = [elem.text for elem in sense.xpath('gloss[@g_type="tm"]')]
-
-        # Get the ent_seq of the containing entry
-        ent_seq = int(entry.find('ent_seq').text)
-
-        # Create the sense node and get its node ID
-        with contextlib.ExitStack() as stack:
-            session_ = session or stack.enter_context(self.driver.session())
-            sense_id = session_.write_transaction(
-                self._merge_and_return_sense,
-                ent_seq,
-                rank,
-                pos,
-                fields,
-                miscs,
-                s_infs,
-                defns,
-                expls,
-                figs,
-                lits,
-                tms,
-            )
-            # TODO: relate stagks for sense
-            logger.debug(
-                'Added sense %s to entry %s',
-                sense_id,
-                ent_seq,
-            )
-            kanji_relationhips = session_.write_transaction(
-                self._merge_kanji_sense_relationships,
-                ent_seq,
-                sense_id,
-                stagks,
-            )
-            logger.debug(
-                'Added sense relationships to kanji: %s',
-                list(zip(stagks, kanji_relationhips)),
-            )
-            reading_relationships = session_.write_transaction(
-                self._merge_reading_sense_relationships,
-                ent_seq,
-                sense_id,
-                stagrs,
-            )
-            logger.debug(
-                'Added sense relationships to readings: %s',
-                list(zip(stagrs, reading_relationships)),
-            )
+    @staticmethod
+    def _merge_kanji_reading_relationships(
+        tx: Transaction,
+        rows: List[Dict[str, Any]],
+    ) -> int:
+        """Merges reading->kanji relationships for `rows` and counts them."""
 
-        return sense_id
+        result = tx.run(CYPHER_MERGE_KANJI_READINGS, rows=rows)
+        return result.single()['count']
 
     @staticmethod
-    def _merge_and_return_sense(
+    def _merge_and_return_senses_for_entries(
         tx: Transaction,
-        ent_seq: int,
-        rank: int,
-        pos: List[str],
-        fields: List[str],
-        miscs: List[str],
-        s_infs: List[str],
-        defns: List[str],
-        expls: List[str],
-        figs: List[str],
-        lits: List[str],
-        tms: List[str],
+        rows: List[Dict[str, Any]],
     ) -> int:
-        """Merges and returns sense related to entry `ent_seq`."""
-
-        # Add a node for the entry
-        cypher = textwrap.dedent("""\
-            MATCH (e:Entry {ent_seq: $ent_seq})
-            MERGE (e)-[:CONTAINS]->(s:Sense {ent_seq: $ent_seq, rank: $rank})
-            ON CREATE
-              SET s.pos = $pos
-              SET s.field = $fields
-              SET s.misc = $miscs
-              SET s.s_inf = $s_infs
-              SET s.defn = $defns
-              SET s.expl = $expls
-              SET s.fig = $figs
-              SET s.lit = $lits
-              SET s.tm = $tms
-            RETURN id(s) AS node_id
-        """)
-        result = tx.run(
-            cypher,
-            ent_seq=ent_seq,
-            rank=rank,
-            pos=pos,
-            fields=fields,
-            miscs=miscs,
-            s_infs=s_infs,
-            defns=defns,
-            expls=expls,
-            figs=figs,
-            lits=lits,
-            tms=tms,
-        )
-        record = result.single()
+        """Merges senses for `rows` into their entries and counts them."""
 
-        return record['node_id']
+        result = tx.run(CYPHER_MERGE_SENSES, rows=rows)
+        return result.single()['count']
 
     @staticmethod
     def _merge_kanji_sense_relationships(
         tx: Transaction,
-        ent_seq: int,
-        sense_id: int,
-        stagks: List[str],
-    ) -> List[int]:
-        """Merges kanji->sense relationships under `ent_seq`."""
-
-        # Add a node for the entry
-        cypher = textwrap.dedent("""\
-            MATCH (e:Entry {ent_seq: $ent_seq})
-            UNWIND $stagks as keb
-            MATCH (s:Sense)<-[:CONTAINS]-(e)-[:CONTAINS]->
-                  (k:Kanji {keb: keb})
-            WHERE id(s) = $sense_id
-            MERGE (k)-[r:HAS_SENSE]->(s)
-            RETURN id(r) AS node_id
-        """)
-        result = tx.run(
-            cypher,
-            ent_seq=ent_seq,
-            sense_id=sense_id,
-            stagks=stagks,
-        )
-        return result.value()
+        rows: List[Dict[str, Any]],
+    ) -> int:
+        """Merges kanji->sense relationships for `rows` and counts them."""
+
+        result = tx.run(CYPHER_MERGE_KANJI_SENSES, rows=rows)
+        return result.single()['count']
 
     @staticmethod
     def _merge_reading_sense_relationships(
         tx: Transaction,
-        ent_seq: int,
-        sense_id: int,
-        stagrs: List[str],
-    ) -> List[int]:
-        """Merges reading->sense relationships under `ent_seq`."""
-
-        # Add a node for the entry
-        cypher = textwrap.dedent("""\
-            MATCH (e:Entry {ent_seq: $ent_seq})
-            UNWIND $stagrs as reb
-            MATCH (s:Sense)<-[:CONTAINS]-(e)-[:CONTAINS]->
-                  (k:Reading {reb: reb})
-            WHERE id(s) = $sense_id
-            MERGE (k)-[r:HAS_SENSE]->(s)
-            RETURN id(r) AS node_id
-        """)
-        result = tx.run(
-            cypher,
-            ent_seq=ent_seq,
-            sense_id=sense_id,
-            stagrs=stagrs,
-        )
-        return result.value()
-
-    def add_lsource_for_sense(
-        self,
-        lsource: etree.Element,
-        sense_id: int,
-        session: Optional[Session] = None,
+        rows: List[Dict[str, Any]],
     ) -> int:
-        """Adds an `lsource` related to sense node `sense_id` in the database.
-
-        Args:
-            lsource: The lsource element.
-            sense_id: The associated sense node ID.
-            session: A driver session for the work.
-
-        Returns:
-            Tuple of:
-             - Merged Language node.
-             - Merged Sense->Language relationship.
-        """
-
-        # Standard XML namespace
-        ns = 'http://www.w3.org/XML/1998/namespace'
+        """Merges reading->sense relationships for `rows` and counts them."""
 
-        # Parse lang, and check for ls_type and ls_wasei
-        lang = lsource.attrib.get(f'{{{ns}}}lang', 'eng')
-        partial = lsource.attrib.get('ls_type', 'full') == 'partial'
-        wasei = lsource.attrib.get('ls_wasei', 'n') == 'y'
-
-        # Get the source language word or phrase
-        phrase = lsource.text
-
-        with contextlib.ExitStack() as stack:
-            session_ = session or stack.enter_context(self.driver.session())
-            lsource_id, relationship_id = session_.write_transaction(
-                self._merge_and_return_lsource,
-                sense_id,
-                lang,
-                phrase,
-                partial,
-                wasei,
-            )
-            logger.debug(
-                'Added lsource %s for sense with ID %s',
-                lang,
-                sense_id,
-            )
-            return lsource_id, relationship_id
+        result = tx.run(CYPHER_MERGE_READING_SENSES, rows=rows)
+        return result.single()['count']
 
     @staticmethod
-    def _merge_and_return_lsource(
+    def _merge_and_return_lsources_for_senses(
         tx: Transaction,
-        sense_id: int,
-        lang: str,
-        phrase: str,
-        partial: bool,
-        wasei: bool,
-    ) -> Tuple[int, int]:
-        """Merges and returns lsource for sense `sense_id` in the database."""
-
-        # Add a node for the entry
-        cypher = textwrap.dedent("""\
-            MATCH (s:Sense)
-            WHERE id(s) = $sense_id
-            MERGE (l:Language {lang: $lang})
-            MERGE (s)-[r:SOURCED_FROM]->(l)
-            ON CREATE
-              SET r.phrase = $phrase
-              SET r.partial = $partial
-              SET r.wasei = $wasei
-            RETURN id(l) AS node_id, id(r) as relationship_id
-        """)
-        result = tx.run(
-            cypher,
-            sense_id=sense_id,
-            lang=lang,
-            phrase=phrase,
-            partial=partial,
-            wasei=wasei,
-        )
-        record = result.single()
-        return record['node_id'], record['relationship_id']
-
-    def add_example_for_sense(
-        self,
-        example: etree.Element,
-        sense_id: int,
-        session: Optional[Session] = None,
+        rows: List[Dict[str, Any]],
     ) -> int:
-        """Adds an `example` for `sense` to the database.
-
-        Args:
-            example: The example element.
-            sense_id: The associated sense node ID.
-            session: A driver session for the work.
-        """
-
-        # <example>
-        # <ex_srce exsrc_type="tat">100041</ex_srce>
-        # <ex_text>学位</ex_text>
-        # <ex_sent xml:lang="jpn">彼は法学修士の学位を得た。</ex_sent>
-        # <ex_sent xml:lang="eng">He got a master's degree in law.</ex_sent>
-        # </example>
+        """Merges lsources for `rows` into their senses and counts them."""
 
-        # Parse out Tatoeba sequence number (validating it is Tatoeba Project)
-        ex_srce = example.find('ex_srce')
-        exsrc_type = ex_srce.attrib.get('exsrc_type', 'tat')
-        assert exsrc_type == 'tat', f'Unexpected source type {exsrc_type!r}'
-        tat = ex_srce.text
+        result = tx.run(CYPHER_MERGE_LSOURCES, rows=rows)
+        return result.single()['count']
 
-        # Standard XML namespace
-        ns = 'http://www.w3.org/XML/1998/namespace'
-
-        # Parse out the example sentences
-        # NOTE: The following test was used to confirm examples come in pairs
-        # > grep '<ex_sent' JMdict_e_examp.xml -n | \
-        # >>  cut -d: -f1 | awk 'NR > 1 { print $0 - prev } { prev = $0 }' | \
-        # >>  awk 'NR%2==1 { print $0 }' | \
-        # >>  uniq
-        # 1
+    @staticmethod
+    def _merge_and_return_examples_for_senses(
+        tx: Transaction,
+        rows: List[Dict[str, Any]],
+    ) -> int:
+        """Merges examples for `rows` into their senses and counts them."""
 
-        def lang(elem):
-            return elem.attrib.get(f'{{{ns}}}lang', 'eng')
+        result = tx.run(CYPHER_MERGE_EXAMPLES, rows=rows)
+        return result.single()['count']
 
-        ex_sents = {lang(el): el.text for el in example.findall('ex_sent')}
+    def ingest_ref_batch(self, refs: List[Dict[str, Any]]):
+        """Adds a batch of refs (``xref`` or ``ant``) in one transaction.
 
-        # Parse out the example text for this sense_id
-        ex_text = example.find('ex_text').text
+        Args:
+            refs: The ref rows, as returned by `parse_ref`.
+        """
 
-        with contextlib.ExitStack() as stack:
-            session_ = session or stack.enter_context(self.driver.session())
-            lsource_id, relationship_id = session_.write_transaction(
-                self._merge_and_return_example,
-                sense_id,
-                tat,
-                ex_sents,
-                ex_text,
-            )
-            logger.debug(
-                'Added example %s for sense with ID %s',
-                example,
-                sense_id,
+        with self.open_session() as session:
+            count = session.write_transaction(
+                self._merge_ref_relationships,
+                refs,
             )
-            return lsource_id, relationship_id
+            logger.debug('Added %s x-reference relationships', count)
 
     @staticmethod
-    def _merge_and_return_example(
+    def _merge_ref_relationships(
         tx: Transaction,
-        sense_id: int,
-        tat: int,
-        ex_sents: Dict[str, str],
-        ex_text: str,
-    ) -> Tuple[int, int]:
-        """Merges and returns lsource for sense `sense_id` in the database."""
-
-        # Convert Dict[str, str] to eng and jpn ex_sent str
-        eng = ex_sents['eng']
-        jpn = ex_sents['jpn']
-
-        # Add a node for the entry
-        cypher = textwrap.dedent("""\
-            MATCH (s:Sense)
-            WHERE id(s) = $sense_id
-            MERGE (e:Example {tat: $tat})
-            MERGE (s)-[r:USED_IN]->(e)
-            ON CREATE
-              SET r.ex_text = $ex_text
-              SET e.eng = $eng
-              SET e.jpn = $jpn
-            RETURN id(e) AS node_id, id(r) as relationship_id
-        """)
-        result = tx.run(
-            cypher,
-            sense_id=sense_id,
-            tat=tat,
-            ex_text=ex_text,
-            eng=eng,
-            jpn=jpn,
-        )
-        record = result.single()
-        return record['node_id'], record['relationship_id']
-
-    def add_ref(
-        self,
-        ref: etree.Element,
-        session: Optional[Session] = None,
+        rows: List[Dict[str, Any]],
     ) -> int:
-        """Adds an `ref` (either ``xref`` or ``ant`` to the database.
+        """Merges xrefs for the refs in `rows` and counts them."""
 
-        Args:
-            ref: The ref element.
-            session: A driver session for the work.
-        """
+        result = tx.run(CYPHER_MERGE_REFS, rows=rows)
+        return result.single()['count']
 
-        # Get the parent sense and grandparent entry elements
-        sense = ref.getparent()
-        entry = sense.getparent()
 
-        # Get the ent_seq and sense rank to find unique sense
-        ent_seq = int(entry.find('ent_seq').text)
-        rank = entry.findall('sense').index(sense) + 1
+def positive_int(value: str) -> int:
+    """Converts `value` to an int, rejecting values below 1.
 
-        # Parse the ref text and figure out whether it is an antonym ref
-        data = parse_xref(ref.text)
-        antonym = ref.tag == 'ant'
+    Args:
+        value: The command line argument to convert.
 
-        with contextlib.ExitStack() as stack:
-            session_ = session or stack.enter_context(self.driver.session())
-            xref_ids = session_.write_transaction(
-                self._merge_ref_relationships,
-                ent_seq,
-                rank,
-                antonym,
-                **data,
-            )
-            logger.debug(
-                'Added x-reference relationships for %r under entry %s: %s',
-                ref.text,
-                ent_seq,
-                xref_ids,
-            )
-            return xref_ids
+    Returns:
+        The converted value.
 
-    @staticmethod
-    def _merge_ref_relationships(
-        tx: Transaction,
-        ent_seq: int,
-        rank: int,
-        antonym: bool,
-        keb: Optional[str] = None,
-        reb: Optional[str] = None,
-        sense: Optional[int] = None,
-    ) -> List[int]:
-        """Merges and returns xrefs under entry with `ent_seq` in db."""
-
-        # 1. find the kanji
-        # 2. find the parent entries
-        # 3. order those entries by ent_seq number
-        # 4. relate the sense to only the kanji that is beneath the 1st entry
-
-        cypher = textwrap.dedent("""\
-            MATCH (r:Reading)-[:CONTAINS]-(e:Entry)-[:CONTAINS]->(k:Kanji)
-            WHERE
-              r.reb = coalesce($reb, r.reb) AND
-              ($keb IS NULL OR (k IS NOT NULL AND k.keb = $keb))
-            WITH e
-            ORDER BY e.ent_seq
-            LIMIT 1
-            MATCH (src:Sense {ent_seq: $ent_seq, rank: $rank})
-            WITH e, src
-            MATCH (e)-[:CONTAINS]->(dest:Sense)
-            WHERE $sense IS NULL OR dest.rank = $sense
-            MERGE (src)-[xref:RELATED_TO {antonym: $antonym}]->(dest)
-            RETURN id(xref) as relationship_id
-        """)
-        result = tx.run(
-            cypher,
-            ent_seq=ent_seq,
-            rank=rank,
-            antonym=antonym,
-            keb=keb,
-            reb=reb,
-            sense=sense,
-        )
-        return result.value('relationship_id')
+    Raises:
+        argparse.ArgumentTypeError: If `value` is not a positive integer.
+    """
+
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(
+            f'{value!r} is not a positive integer')
+    return number
 
 
 def get_parser(argv: List[str]) -> argparse.ArgumentParser:
@@ -893,6 +1060,9 @@ def get_parser(argv: List[str]) -> argparse.ArgumentParser:
     )
     parser.add_argument('-u', '--user', default='neo4j', help='Neo4j user')
     parser.add_argument('-p', '--pw', default='japanese', help='Neo4j pw')
+    parser.add_argument('-D', '--database',
+                        help='Neo4j database to write to (default: the '
+                             "user's home database, looked up once)")
     group = parser.add_mutually_exclusive_group()
     group.add_argument('-d', '--debug', action='store_true',
                        help='Display debug log messages')
@@ -902,8 +1072,21 @@ def get_parser(argv: List[str]) -> argparse.ArgumentParser:
     parser.add_argument('--neo4j-debug', action='store_true',
                         help='Display Neo4j driver debug messages')
 
-    parser.add_argument('--skip-entries', action='store_true',
-                        help='Skip over operations on entry elements')
+    parser.add_argument('-w', '--workers', type=positive_int, default=8,
+                        help='Number of concurrent Neo4j writer sessions')
+    parser.add_argument('-b', '--batch-size', type=positive_int, default=1024,
+                        help='Number of entries or refs parsed per batch')
+
+    entry_group = parser.add_mutually_exclusive_group()
+    entry_group.add_argument('--create-entries', action='store_const',
+                             dest='entry_mode', const='create',
+                             help='Create entry nodes without merging '
+                                  '(empty DB)')
+    entry_group.add_argument('--skip-entries', action='store_const',
+                             dest='entry_mode', const='skip',
+                             help='Skip over operations on entry elements')
+    parser.set_defaults(entry_mode='merge')
+
     parser.add_argument('--skip-kanji', action='store_true',
                         help='Skip over operations on kanji elements')
     parser.add_argument('--skip-readings', action='store_true',
@@ -916,21 +1099,19 @@ def get_parser(argv: List[str]) -> argparse.ArgumentParser:
     return parser
 
 
-def grouper(
-    iterable: Iterable[etree.Element],
-    n: int,
-) -> Iterable[Sequence[etree.Element]]:
-    """Groups `iterable` into sequences of length `n`.
+def chunks(iterable: Iterable[T], n: int) -> Iterator[List[T]]:
+    """Divides `iterable` into lists of length `n`.
 
     Args:
-        iterable: The object to divide into groups.
-        n: The group size.
+        iterable: The object to divide into chunks.
+        n: The chunk size.
 
     Returns:
-        Iterable of sequences of length `n`.
+        Iterator of lists of length `n`, the last of which may be shorter.
     """
-    args = [iter(iterable)] * n
-    return itertools.zip_longest(*args)
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, n)):
+        yield chunk
 
 
 def configure_logger(log: logging.Logger, level: str):
@@ -956,6 +1137,127 @@ def configure_logger(log: logging.Logger, level: str):
     log.addHandler(handler)
 
 
+def shard_entry_batch(
+    batch: List[etree.Element],
+    args: argparse.Namespace,
+    ref_rows: List[Dict[str, Any]],
+) -> List[Tuple[List[Dict[str, Any]], ...]]:
+    """Parses a batch of entries into rows sharded by ``ent_seq``.
+
+    Sharding by ``ent_seq % args.workers`` means no two workers write to the
+    same entry's nodes. Each entry is freed once its rows are built.
+
+    Args:
+        batch: The entry elements, as yielded by `iterparse_entries`.
+        args: The parsed command line arguments.
+        ref_rows: List to extend with the entries' ref rows.
+
+    Returns:
+        List of ``args.workers`` tuples of entry, kanji, reading, sense,
+        lsource and example rows.
+    """
+
+    shards = [tuple([] for _ in range(6)) for _ in range(args.workers)]
+    for entry in batch:
+        # Get the ent_seq once for all of the entry's children
+        entry_row = parse_entry(entry)
+        ent_seq = entry_row['ent_seq']
+        (
+            entry_rows,
+            kanji_rows,
+            reading_rows,
+            sense_rows,
+            lsource_rows,
+            example_rows,
+        ) = shards[ent_seq % args.workers]
+
+        entry_rows.append(entry_row)
+
+        # Parse the children and keep the rows that are not skipped
+        kanji, readings, senses, lsources, examples, refs = (
+            parse_entry_children(
+                entry,
+                ent_seq,
+                parse_refs=not args.skip_refs,
+            )
+        )
+        if not args.skip_kanji:
+            kanji_rows.extend(kanji)
+        if not args.skip_readings:
+            reading_rows.extend(readings)
+        if not args.skip_senses:
+            sense_rows.extend(senses)
+            lsource_rows.extend(lsources)
+            example_rows.extend(examples)
+
+        # Keep refs until all of the entries they may point to exist
+        ref_rows.extend(refs)
+
+        # The rows hold everything needed, so free the entry's subtree
+        free_entry(entry)
+
+    return shards
+
+
+def ingest_entries(
+    neo_app: NeoApp,
+    args: argparse.Namespace,
+    now: datetime.datetime,
+) -> List[Dict[str, Any]]:
+    """Streams the entries of ``args.xml_file`` into the database.
+
+    Batch shards are merged concurrently by a pool of ``args.workers``
+    sessions. If anything fails, shards that have not started are cancelled
+    and running ones are waited for, so no shard outlives `neo_app`.
+
+    Args:
+        neo_app: The application to add the entries with.
+        args: The parsed command line arguments.
+        now: The start time, for logging elapsed time.
+
+    Returns:
+        The ref rows of all entries, to merge once every entry exists.
+    """
+
+    entries = iterparse_entries(args.xml_file)
+    pending = collections.deque()
+    ref_rows = []
+    with concurrent.futures.ThreadPoolExecutor(args.workers) as pool:
+        try:
+            for num, batch in enumerate(chunks(entries, args.batch_size)):
+                logger.info(
+                    'Processing entry batch: %s, elapsed time: %s',
+                    num + 1,
+                    datetime.datetime.now() - now,
+                )
+                shards = shard_entry_batch(batch, args, ref_rows)
+
+                # Merge each shard in its own session and transaction
+                pending.extend(
+                    pool.submit(
+                        neo_app.ingest_entry_batch,
+                        *shard,
+                        entry_mode=args.entry_mode,
+                    )
+                    for shard in shards if any(shard)
+                )
+
+                # Keep parsing while shards merge, but bound the pending
+                # work so the parser cannot run too far ahead of the database
+                while len(pending) > 2 * args.workers:
+                    pending.popleft().result()
+
+            # Wait for the remaining shards before merging any refs
+            while pending:
+                pending.popleft().result()
+        except BaseException:
+            # Cancel the shards not yet started before the driver closes
+            pool.shutdown(cancel_futures=True)
+            raise
+
+    return ref_rows
+
+
 def main(argv=sys.argv[1:]):
     """Does it all."""
 
@@ -971,90 +1273,32 @@ def main(argv=sys.argv[1:]):
     neo4j_level = 'DEBUG' if args.neo4j_debug else 'WARNING'
     configure_logger(neo4j_logger, neo4j_level)
 
-    # Read the specified XML file and parse the XML tree
-    with open(args.xml_file) as xmlf:
-        tree = etree.parse(xmlf)
-
-    # Get the tree's root element for traversal
-    root = tree.getroot()
-
-    # Create a Neo4j GraphApp instance
-    neo_app = NeoApp(args.neo4j_uri, args.user, args.pw)
-
-    # Set constraints for DB schema
-    neo_app.create_entry_constraint()
-    neo_app.create_lsource_constraint()
-    neo_app.create_example_constraint()
-
-    # Create indices for DB schema
-    neo_app.create_kanji_index()
-    neo_app.create_reading_index()
-    neo_app.create_sense_index()
-
-    # Traverse from root on <entry> elements and add nodes
-    now = datetime.datetime.now()
-    for num, batch in enumerate(grouper(root.iter('entry'), 1024)):
-        logger.info(
-            'Processing entry batch: %s, elapsed time: %s',
-            num + 1,
-            datetime.datetime.now() - now,
-        )
-        with neo_app.driver.session() as session:
-            for entry in batch:
-                if entry is None:
-                    break
-                if not args.skip_entries:
-                    neo_app.add_entry(entry, session)
-
-                if not args.skip_kanji:
-                    for k_ele in entry.findall('k_ele'):
-                        neo_app.add_kanji_for_entry(k_ele, entry, session)
-
-                if not args.skip_readings:
-                    for r_ele in entry.findall('r_ele'):
-                        neo_app.add_reading_for_entry(r_ele, entry, session)
-
-                if not args.skip_senses:
-                    for idx, sense in enumerate(entry.findall('sense')):
-                        sense_id = neo_app.add_sense_for_entry(
-                            idx,
-                            sense,
-                            entry,
-                            session,
-                        )
-
-                        for lsource in sense.findall('lsource'):
-                            neo_app.add_lsource_for_sense(
-                                lsource,
-                                sense_id,
-                                session,
-                            )
-
-                        for example in sense.findall('example'):
-                            neo_app.add_example_for_sense(
-                                example,
-                                sense_id,
-                                session,
-                            )
-
-    if not args.skip_refs:
-        xref_or_ant = './/*[self::xref or self::ant]'
-        for num, batch in enumerate(grouper(root.xpath(xref_or_ant), 1024)):
-            logger.info(
-                'Processing ref batch: %s, elapsed time: %s',
-                num + 1,
-                datetime.datetime.now() - now,
-            )
-            with neo_app.driver.session() as session:
-                for ref in batch:
-                    if ref is None:
-                        break
-                    neo_app.add_ref(ref, session)
-
-    logger.info('Total elapsed time: %s', datetime.datetime.now() - now)
-
-    # Close the neo_app
-    neo_app.close()
+    # Create a Neo4j GraphApp instance, closing it when done
+    with NeoApp(
+        args.neo4j_uri,
+        args.user,
+        args.pw,
+        args.database,
+    ) as neo_app:
+        # Pin the database by name, then set up the DB schema before adding
+        # any nodes
+        neo_app.resolve_database()
+        neo_app.ensure_schema()
+
+        # Stream <entry> elements from the XML file and add nodes
+        now = datetime.datetime.now()
+        ref_rows = ingest_entries(neo_app, args, now)
+
+        if ref_rows:
+            for num, batch in enumerate(chunks(ref_rows, args.batch_size)):
+                logger.info(
+                    'Processing ref batch: %s, elapsed time: %s',
+                    num + 1,
+                    datetime.datetime.now() - now,
+                )
+                neo_app.ingest_ref_batch(batch)
+
+        logger.info('Total elapsed time: %s', datetime.datetime.now() - now)
 
 
 if __name__ == '__main__':